@@ -4,9 +4,32 @@ Generate the exact working test images that successfully passed ML Kit OCR tests
 These are the same images created in MLKitOCRTest.kt that detected text perfectly.
 """
 
+from functools import lru_cache
 from PIL import Image, ImageDraw, ImageFont
 import os
 
+FONT_NAMES = ("arial.ttf", "calibri.ttf")
+
+def find_font_path():
+    """Return the path of the first preferred font Pillow can find, or None"""
+    for name in FONT_NAMES:
+        try:
+            # Pillow searches the platform font directories for bare names
+            return ImageFont.truetype(name, 1).path
+        except (OSError, ImportError):
+            pass
+    return None
+
+# Resolved once so failed lookups don't repeat for every font size
+FONT_PATH = find_font_path()
+
+@lru_cache(maxsize=8)
+def load_font(size):
+    """Load the resolved font at the given size, falling back to the default font"""
+    if FONT_PATH:
+        return ImageFont.truetype(FONT_PATH, size)
+    return ImageFont.load_default()
+
 def create_wifi_test_image():
     """Create the WiFi credentials test image that worked in MLKitOCRTest"""
     # Same dimensions as in MLKitOCRTest.kt
@@ -16,14 +39,7 @@ def create_wifi_test_image():
     image = Image.new('RGB', (width, height), 'white')
     draw = ImageDraw.Draw(image)
 
-    # Try to use a bold font, fallback to default if not available
-    try:
-        font = ImageFont.truetype("arial.ttf", 32)
-    except:
-        try:
-            font = ImageFont.truetype("calibri.ttf", 32)
-        except:
-            font = ImageFont.load_default()
+    font = load_font(32)
 
     # Draw the same text that ML Kit successfully detected
     draw.text((50, 70), "SSID: TestNetwork", fill='black', font=font)
@@ -41,14 +57,7 @@ def create_simple_test_image():
     image = Image.new('RGB', (width, height), 'white')
     draw = ImageDraw.Draw(image)
 
-    # Try to use a bold font
-    try:
-        font = ImageFont.truetype("arial.ttf", 48)
-    except:
-        try:
-            font = ImageFont.truetype("calibri.ttf", 48)
-        except:
-            font = ImageFont.load_default()
+    font = load_font(48)
 
     # Center the text
     text = "HELLO CAMERA TEST"
@@ -70,13 +79,13 @@ def main():
     # Generate and save the working WiFi test image
     wifi_image = create_wifi_test_image()
     wifi_path = os.path.join(tests_dir, "working_wifi_test_image.png")
-    wifi_image.save(wifi_path)
+    wifi_image.save(wifi_path, format="PNG", compress_level=1, optimize=False)
     print(f"Saved working WiFi test image: {wifi_path}")
 
     # Generate and save the simple test image
     simple_image = create_simple_test_image()
     simple_path = os.path.join(tests_dir, "working_simple_test_image.png")
-    simple_image.save(simple_path)
+    simple_image.save(simple_path, format="PNG", compress_level=1, optimize=False)
     print(f"Saved working simple test image: {simple_path}")
 
     print("\nThese images successfully passed ML Kit OCR tests:")